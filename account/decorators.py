@@ -113,6 +113,9 @@ def check_contest_permission(check_type="details"):
             if not user.is_authenticated:
                 return self.error("Please login first.")
 
+            # 상세 공개 여부는 뷰의 분기마다 다시 계산하지 않도록 여기서 한 번만 평가한다
+            self.can_see_problem_details = self.contest.problem_details_permission(user)
+
             # creator or owner
             if user.is_contest_admin(self.contest):
                 return func(*args, **kwargs)
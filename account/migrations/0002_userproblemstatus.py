@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-09-01 16:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_user_problem_status(apps, schema_editor):
+    """profile JSON 에 쌓인 문제 상태를 새 테이블로 옮긴다"""
+    UserProfile = apps.get_model("account", "UserProfile")
+    UserProblemStatus = apps.get_model("account", "UserProblemStatus")
+    rows = {}
+    for profile in UserProfile.objects.all().iterator():
+        for rule_type, blob in (("ACM", profile.acm_problems_status),
+                                ("OI", profile.oi_problems_status)):
+            for namespace in ("problems", "contest_problems"):
+                for problem_id, info in (blob or {}).get(namespace, {}).items():
+                    try:
+                        problem_id = int(problem_id)
+                    except (TypeError, ValueError):
+                        continue
+                    rows[(profile.user_id, problem_id)] = UserProblemStatus(
+                        user_id=profile.user_id, problem_id=problem_id,
+                        rule_type=rule_type, status=info.get("status"))
+    UserProblemStatus.objects.bulk_create(rows.values(), batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserProblemStatus',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('problem_id', models.IntegerField()),
+                ('rule_type', models.TextField()),
+                ('status', models.IntegerField(null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_problem_status',
+                'unique_together': {('user', 'problem_id')},
+            },
+        ),
+        migrations.RunPython(backfill_user_problem_status, migrations.RunPython.noop),
+    ]
@@ -164,6 +164,24 @@ class UserProfile(models.Model):
         db_table = "user_profile"
 
 
+class UserProblemStatus(models.Model):
+    """
+    profile 의 acm/oi_problems_status JSON 을 대체하는 사용자별 문제 상태 테이블.
+    페이지에 보이는 문제 id 만 골라서 인덱스 조회할 수 있다
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Submission.user_id 처럼 순환 import 를 피하려고 FK 대신 id 만 저장한다
+    problem_id = models.IntegerField()
+    # One of ProblemRuleType
+    rule_type = models.TextField()
+    # One of JudgeStatus
+    status = models.IntegerField(null=True)
+
+    class Meta:
+        db_table = "user_problem_status"
+        unique_together = (("user", "problem_id"),)
+
+
 class UserScore(models.Model):
     user = models.OneToOneField(User, primary_key=True, unique=True, on_delete=models.CASCADE)
 
@@ -144,19 +144,13 @@ class DashboardRankSerializer(serializers.ModelSerializer):
 
 
 class HomeRankingSerializer(serializers.ModelSerializer):
-    avatar = serializers.SerializerMethodField()
-    username = serializers.SerializerMethodField()
+    avatar = serializers.CharField(source="user.userprofile.avatar")
+    username = serializers.CharField(source="user.username")
 
     class Meta:
         model = UserScore
         fields = ['avatar', 'tier', 'username', 'total_score', 'fluctuation']
 
-    def get_avatar(self, obj):
-        return obj.user.userprofile.avatar
-
-    def get_username(self, obj):
-        return obj.user.username
-
 
 class EditUserSerializer(serializers.Serializer):
     id = serializers.IntegerField()
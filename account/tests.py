@@ -3,16 +3,20 @@ import time
 from unittest import mock
 from datetime import timedelta
 from copy import deepcopy
+from importlib import import_module
 
+from django.apps import apps
 from django.contrib import auth
 from django.utils.timezone import now
 from otpauth import OtpAuth
 
+from judge.dispatcher import JudgeDispatcher
+from submission.models import JudgeStatus
 from utils.api.tests import APIClient, APITestCase
 from utils.shortcuts import rand_str
 from options.options import SysOptions
 
-from .models import AdminType, ProblemPermission, User
+from .models import AdminType, ProblemPermission, User, UserProblemStatus
 from utils.constants import ContestRuleType
 
 
@@ -644,3 +648,53 @@ class OpenAPIAppkeyAPITest(APITestCase):
         resp = self.client.parent_post(self.url, data={})
         self.assertSuccess(resp)
         self.assertEqual(resp.data["data"]["appkey"], User.objects.get(username=self.user.username).open_api_appkey)
+
+
+class UserProblemStatusSyncTest(APITestCase):
+    def setUp(self):
+        self.user = self.create_user("test", "test123", login=False)
+
+    def sync(self, result, rule_type=ContestRuleType.ACM, overwrite_ac=False):
+        dispatcher = mock.MagicMock()
+        dispatcher.submission.user_id = self.user.id
+        dispatcher.submission.result = result
+        dispatcher.problem.id = 1
+        JudgeDispatcher._sync_user_problem_status(dispatcher, rule_type, overwrite_ac=overwrite_ac)
+
+    def test_first_submission_creates_row(self):
+        self.sync(JudgeStatus.WRONG_ANSWER)
+        status = UserProblemStatus.objects.get(user=self.user, problem_id=1)
+        self.assertEqual(status.status, JudgeStatus.WRONG_ANSWER)
+        self.assertEqual(status.rule_type, ContestRuleType.ACM)
+
+    def test_accepted_is_preserved(self):
+        self.sync(JudgeStatus.ACCEPTED)
+        self.sync(JudgeStatus.WRONG_ANSWER)
+        self.assertEqual(UserProblemStatus.objects.get(user=self.user, problem_id=1).status,
+                         JudgeStatus.ACCEPTED)
+
+    def test_overwrite_ac_for_oi_contest(self):
+        self.sync(JudgeStatus.ACCEPTED)
+        self.sync(JudgeStatus.WRONG_ANSWER, rule_type=ContestRuleType.OI, overwrite_ac=True)
+        self.assertEqual(UserProblemStatus.objects.get(user=self.user, problem_id=1).status,
+                         JudgeStatus.WRONG_ANSWER)
+
+
+class UserProblemStatusBackfillTest(APITestCase):
+    def test_backfill_from_profile_json(self):
+        user = self.create_user("test", "test123", login=False)
+        profile = user.userprofile
+        profile.acm_problems_status = {"problems": {"1": {"status": JudgeStatus.ACCEPTED, "_id": "A-1"}},
+                                       "contest_problems": {"2": {"status": JudgeStatus.WRONG_ANSWER, "_id": "A-2"}}}
+        profile.oi_problems_status = {"problems": {"3": {"status": JudgeStatus.ACCEPTED, "_id": "A-3", "score": 10}}}
+        profile.save()
+
+        backfill = import_module("account.migrations.0002_userproblemstatus").backfill_user_problem_status
+        backfill(apps, None)
+
+        rows = {s.problem_id: s for s in UserProblemStatus.objects.filter(user=user)}
+        self.assertEqual(set(rows), {1, 2, 3})
+        self.assertEqual(rows[1].status, JudgeStatus.ACCEPTED)
+        self.assertEqual(rows[1].rule_type, ContestRuleType.ACM)
+        self.assertEqual(rows[2].status, JudgeStatus.WRONG_ANSWER)
+        self.assertEqual(rows[3].rule_type, ContestRuleType.OI)
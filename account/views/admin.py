@@ -112,7 +112,7 @@ class UserAdminAPI(APIView):
                 return self.error("User does not exist")
             return self.success(UserAdminSerializer(user).data)
 
-        user = User.objects.all().order_by("-create_time")
+        user = User.objects.select_related("userprofile").order_by("-create_time")
 
         keyword = request.GET.get("keyword", None)
         if keyword:
@@ -17,7 +17,7 @@ from django.db.models import F, Count, Q
 from django.db import transaction
 
 from problem.models import Problem
-from utils.constants import ContestRuleType
+from utils.constants import CacheKey, ContestRuleType
 from options.options import SysOptions
 from utils.api import APIView, validate_serializer, CSRFExemptAPIView
 from utils.captcha import Captcha
@@ -28,10 +28,9 @@ from ..serializers import (ApplyResetPasswordSerializer, ResetPasswordSerializer
                            UserChangePasswordSerializer, UserLoginSerializer,
                            UserRegisterSerializer, UsernameOrEmailCheckSerializer,
                            RankInfoSerializer, UserChangeEmailSerializer, SSOSerializer,
-                           CollegeListSerializer, DepartmentSerializer, RankingSerializer,
+                           CollegeListSerializer, DepartmentSerializer,
                            DashboardSubmissionSerializer,
-                           DashboardDepartmentSerializer, DashboardCollegeSerializer, DashboardRankSerializer,
-                           HomeRankingSerializer)
+                           DashboardDepartmentSerializer, DashboardCollegeSerializer, DashboardRankSerializer)
 from ..serializers import (TwoFactorAuthCodeSerializer, UserProfileSerializer,
                            EditUserProfileSerializer, ImageUploadForm)
 from ..tasks import send_email_async
@@ -58,13 +57,17 @@ class GetDepartmentListAPI(APIView):
 
 class GetRankingAPI(APIView):
     def get(self, request):
+        # limit 이 없으면 전체 랭킹을 돌려준다
         try:
-            limit = int(request.GET.get("limit", None))
-            if limit:
-                ranking = UserScore.objects.all().order_by('-score')[:limit]
-            else:
-                ranking = UserScore.objects.all().order_by('-score')
-            return self.success(RankingSerializer(ranking, many=True).data)
+            limit = int(request.GET.get("limit", "0"))
+        except ValueError:
+            limit = 0
+        try:
+            ranking = UserScore.objects.order_by('-total_score') \
+                .values("user", "total_score", "fluctuation")
+            if limit > 0:
+                ranking = ranking[:limit]
+            return self.success(list(ranking))
         except UserScore.DoesNotExist:
             return HttpResponseNotFound("no ranking table")
 
@@ -102,6 +105,18 @@ class UserProfileAPI(APIView):
         return self.success(UserProfileSerializer(user_profile, show_real_name=True).data)
 
 
+def get_total_user_count():
+    """
+    랭킹 퍼센타일 계산에 쓰는 전체 사용자 수.
+    거의 변하지 않는 값이라 요청마다 COUNT 하지 않고 5분 캐시한다
+    """
+    count = cache.get(CacheKey.user_count_cache)
+    if count is None:
+        count = UserScore.objects.count()
+        cache.set(CacheKey.user_count_cache, count, timeout=5 * 60)
+    return count
+
+
 # class UserProfileDashBoardAPI(APIView):
 #     @login_required
 #     def get(self, request):
@@ -132,7 +147,7 @@ class UserProfileAPI(APIView):
 #         except UserScore.DoesNotExist:
 #             return HttpResponseNotFound('user_score does not exist')
 #
-#         total_user_count = UserScore.objects.count()
+#         total_user_count = get_total_user_count()
 #
 #         oj_status = {}
 #         oj_status.update(DashboardUserInfoSerializer(user).data)
@@ -147,12 +162,21 @@ class UserProfileAPI(APIView):
 class HomeRankingAPI(APIView):
     def get(self, request):
         # rank, avatar, tier, total_score, fluctuation
-        limit = request.GET.get('limit', 100)
         try:
-            ranking = UserScore.objects.all().order_by('-total_score')[:limit]
+            limit = int(request.GET.get('limit', 100))
+        except ValueError:
+            limit = 100
+        try:
+            ranking = UserScore.objects.order_by('-total_score') \
+                .values("tier", "total_score", "fluctuation",
+                        "user__username", "user__userprofile__avatar")[:limit]
         except UserScore.DoesNotExist:
             return HttpResponseNotFound('no user score table')
-        return self.success(HomeRankingSerializer(ranking, many=True).data)
+        return self.success([{"avatar": row["user__userprofile__avatar"],
+                              "tier": row["tier"],
+                              "username": row["user__username"],
+                              "total_score": row["total_score"],
+                              "fluctuation": row["fluctuation"]} for row in ranking])
 
 
 class AvatarUploadAPI(APIView):
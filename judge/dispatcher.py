@@ -8,7 +8,7 @@ from django.db import transaction, IntegrityError
 from django.db.models import F
 from django.http import HttpResponseNotFound
 
-from account.models import User, UserScore, UserSolved
+from account.models import User, UserProblemStatus, UserScore, UserSolved
 from conf.models import JudgeServer
 from contest.models import ContestRuleType, ACMContestRank, OIContestRank, ContestStatus
 from options.options import SysOptions
@@ -215,6 +215,16 @@ class JudgeDispatcher(DispatcherBase):
         # 문제 채점 끝, 작업 대기열에 남아 있는 작업 처리
         process_pending_task()
 
+    def _sync_user_problem_status(self, rule_type, overwrite_ac=False):
+        # profile JSON 과 user_problem_status 테이블에 이중 기록한다 (조회는 테이블 사용)
+        obj, created = UserProblemStatus.objects.get_or_create(
+            user_id=self.submission.user_id, problem_id=self.problem.id,
+            defaults={"rule_type": rule_type, "status": self.submission.result})
+        if not created and (overwrite_ac or obj.status != JudgeStatus.ACCEPTED) \
+                and obj.status != self.submission.result:
+            obj.status = self.submission.result
+            obj.save(update_fields=["status"])
+
     def update_problem_status_rejudge(self):
         result = str(self.submission.result)
         problem_id = str(self.problem.id)
@@ -240,6 +250,7 @@ class JudgeDispatcher(DispatcherBase):
                         self.update_user_score()
                 profile.acm_problems_status["problems"] = acm_problems_status
                 profile.save(update_fields=["accepted_number", "acm_problems_status"])
+                self._sync_user_problem_status(ProblemRuleType.ACM)
 
             else:
                 oi_problems_status = profile.oi_problems_status.get("problems", {})
@@ -254,6 +265,7 @@ class JudgeDispatcher(DispatcherBase):
                         profile.accepted_number += 1
                 profile.oi_problems_status["problems"] = oi_problems_status
                 profile.save(update_fields=["accepted_number", "oi_problems_status"])
+                self._sync_user_problem_status(ProblemRuleType.OI)
 
     def update_problem_status(self):
         print("in update_problem_status")
@@ -291,6 +303,7 @@ class JudgeDispatcher(DispatcherBase):
                         self.update_user_score()
                 user_profile.acm_problems_status["problems"] = acm_problems_status
                 user_profile.save(update_fields=["submission_number", "accepted_number", "acm_problems_status"])
+                self._sync_user_problem_status(ProblemRuleType.ACM)
 
             else:
                 oi_problems_status = user_profile.oi_problems_status.get("problems", {})
@@ -312,6 +325,7 @@ class JudgeDispatcher(DispatcherBase):
                         user_profile.accepted_number += 1
                 user_profile.oi_problems_status["problems"] = oi_problems_status
                 user_profile.save(update_fields=["submission_number", "accepted_number", "oi_problems_status"])
+                self._sync_user_problem_status(ProblemRuleType.OI)
 
     def update_contest_problem_status(self):
         with transaction.atomic():
@@ -329,6 +343,7 @@ class JudgeDispatcher(DispatcherBase):
                     return
                 user_profile.acm_problems_status["contest_problems"] = contest_problems_status
                 user_profile.save(update_fields=["acm_problems_status"])
+                self._sync_user_problem_status(ContestRuleType.ACM)
 
             elif self.contest.rule_type == ContestRuleType.OI:
                 contest_problems_status = user_profile.oi_problems_status.get("contest_problems", {})
@@ -342,6 +357,8 @@ class JudgeDispatcher(DispatcherBase):
                     contest_problems_status[problem_id]["status"] = self.submission.result
                 user_profile.oi_problems_status["contest_problems"] = contest_problems_status
                 user_profile.save(update_fields=["oi_problems_status"])
+                # OI 대회는 AC 이후에도 점수/상태를 계속 갱신한다
+                self._sync_user_problem_status(ContestRuleType.OI, overwrite_ac=True)
 
             problem = Problem.objects.select_for_update().get(contest_id=self.contest_id, id=self.problem.id)
             result = str(self.submission.result)
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-09-01 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problem', '0024_problem_solved_by'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='problem',
+            index=models.Index(fields=['contest', 'visible', 'field'], name='problem_public_field_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='problem',
+            index=models.Index(fields=['contest', 'visible', 'difficulty'], name='problem_public_diff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='problem',
+            index=models.Index(fields=['contest', 'visible', 'is_bonus'], name='problem_public_bonus_idx'),
+        ),
+    ]
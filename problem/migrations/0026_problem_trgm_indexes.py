@@ -0,0 +1,25 @@
+# 문제 검색(title/_id ILIKE '%kw%')이 btree 를 타지 못해 풀스캔이 되므로
+# pg_trgm GIN 인덱스를 추가한다. Postgres 전용이라 RunSQL 로 작성한다.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problem', '0025_problem_public_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+                "CREATE INDEX IF NOT EXISTS problem_title_trgm ON problem USING gin (title gin_trgm_ops);",
+                "CREATE INDEX IF NOT EXISTS problem__id_trgm ON problem USING gin (_id gin_trgm_ops);",
+            ],
+            reverse_sql=[
+                "DROP INDEX IF EXISTS problem_title_trgm;",
+                "DROP INDEX IF EXISTS problem__id_trgm;",
+            ],
+        ),
+    ]
@@ -39,6 +39,16 @@ def get_default_week_info():
     return {'submission': 0, 'accepted': 0, 'success_rate': 0.0, 'solver': []}
 
 
+class ProblemQuerySet(models.QuerySet):
+    def public(self):
+        """
+        대회에 속하지 않은 공개 문제.
+        직렬화에 필요한 연관 객체를 기본으로 붙여서 호출부의 N+1 재발을 막는다
+        """
+        return self.filter(contest_id__isnull=True, visible=True) \
+            .select_related("created_by").prefetch_related("tags")
+
+
 class Problem(models.Model):
     # display ID
     _id = models.TextField(db_index=True)
@@ -102,10 +112,17 @@ class Problem(models.Model):
     is_most_difficult = models.BooleanField(default=False)
     is_bonus = models.BooleanField(default=False)
 
+    objects = ProblemQuerySet.as_manager()
+
     class Meta:
         db_table = "problem"
         unique_together = (("_id", "contest"),)
         ordering = ("create_time",)
+        indexes = [
+            models.Index(fields=["contest", "visible", "field"], name="problem_public_field_idx"),
+            models.Index(fields=["contest", "visible", "difficulty"], name="problem_public_diff_idx"),
+            models.Index(fields=["contest", "visible", "is_bonus"], name="problem_public_bonus_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         self._id = str(self.id)
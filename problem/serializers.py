@@ -5,7 +5,8 @@ from django import forms
 from options.options import SysOptions
 from utils.api import UsernameSerializer, serializers
 from utils.constants import Difficulty
-from utils.serializers import LanguageNameMultiChoiceField, SPJLanguageNameChoiceField, LanguageNameChoiceField
+from utils.serializers import (CachedFieldsSerializerMixin, LanguageNameMultiChoiceField,
+                               SPJLanguageNameChoiceField, LanguageNameChoiceField)
 
 from .models import Problem, ProblemRuleType, ProblemTag, ProblemIOMode
 from .utils import parse_problem_template
@@ -90,7 +91,7 @@ class EditContestProblemSerializer(CreateOrEditProblemSerializer):
     contest_id = serializers.IntegerField()
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = ProblemTag
         fields = "__all__"
@@ -101,7 +102,7 @@ class CompileSPJSerializer(serializers.Serializer):
     spj_code = serializers.CharField()
 
 
-class BaseProblemSerializer(serializers.ModelSerializer):
+class BaseProblemSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     tags = serializers.SlugRelatedField(many=True, slug_field="name", read_only=True)
     created_by = UsernameSerializer()
 
@@ -276,14 +277,3 @@ class FPSProblemSerializer(serializers.Serializer):
     template = serializers.ListField(child=serializers.DictField(), allow_empty=True, allow_null=True)
     append = serializers.ListField(child=serializers.DictField(), allow_empty=True, allow_null=True)
     prepend = serializers.ListField(child=serializers.DictField(), allow_empty=True, allow_null=True)
-
-
-class RecommendBonusProblemSerializer(serializers.ModelSerializer):
-    tags = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Problem
-        fields = ['id', 'title', 'field', 'tags']
-
-    def get_tags(self, obj):
-        return [tag.name for tag in obj.tags.all()]
@@ -11,11 +11,13 @@ from utils.api.tests import APITestCase
 
 from .models import ProblemTag, ProblemIOMode
 from .models import Problem, ProblemRuleType
+from account.models import UserProblemStatus
 from contest.models import Contest
 from contest.tests import DEFAULT_CONTEST_DATA
+from submission.models import JudgeStatus
 
 from .views.admin import TestCaseAPI
-from .utils import parse_problem_template
+from .utils import parse_problem_template, invalidate_problem_cache
 
 DEFAULT_PROBLEM_DATA = {"_id": "A-110", "title": "test", "description": "<p>test</p>", "input_description": "test",
                         "output_description": "test", "time_limit": 1000, "memory_limit": 256, "difficulty": "Low",
@@ -193,6 +195,60 @@ class ProblemAPITest(ProblemCreateTestBase):
         self.assertSuccess(resp)
 
 
+class ProblemMyStatusAPITest(ProblemCreateTestBase):
+    def setUp(self):
+        invalidate_problem_cache()
+        self.url = self.reverse("problem_api")
+        admin = self.create_admin(login=False)
+        self.problem = self.add_problem(DEFAULT_PROBLEM_DATA, admin)
+        self.user = self.create_user("test", "test123", login=False)
+        # get_by_natural_key 가 email 기준이라 client.login 은 username 으로 통하지 않는다
+        self.client.force_login(self.user)
+
+    def test_list_my_status_from_table(self):
+        UserProblemStatus.objects.create(user=self.user, problem_id=self.problem.id,
+                                         rule_type=ProblemRuleType.ACM, status=JudgeStatus.ACCEPTED)
+        resp = self.client.get(f"{self.url}?limit=10")
+        self.assertSuccess(resp)
+        self.assertEqual(resp.data["data"]["results"][0]["my_status"], JudgeStatus.ACCEPTED)
+
+    def test_detail_my_status_is_per_user(self):
+        UserProblemStatus.objects.create(user=self.user, problem_id=self.problem.id,
+                                         rule_type=ProblemRuleType.ACM, status=JudgeStatus.WRONG_ANSWER)
+        resp = self.client.get(self.url + "?problem_id=" + self.problem._id)
+        self.assertSuccess(resp)
+        self.assertEqual(resp.data["data"]["my_status"], JudgeStatus.WRONG_ANSWER)
+
+        # 캐시된 응답을 공유해도 my_status 는 요청한 사용자 기준이어야 한다
+        self.client.force_login(self.create_user("test2", "test123", login=False))
+        resp = self.client.get(self.url + "?problem_id=" + self.problem._id)
+        self.assertSuccess(resp)
+        self.assertIsNone(resp.data["data"]["my_status"])
+
+
+class ContestProblemMyStatusAPITest(ProblemCreateTestBase):
+    def setUp(self):
+        invalidate_problem_cache()
+        admin = self.create_admin(login=False)
+        contest_data = copy.deepcopy(DEFAULT_CONTEST_DATA)
+        contest_data["password"] = ""
+        contest_data["created_by"] = admin
+        self.contest = Contest.objects.create(**contest_data)
+        self.problem = self.add_problem(DEFAULT_PROBLEM_DATA, admin)
+        self.problem.contest_id = self.contest.id
+        self.problem.save()
+        self.user = self.create_user("test", "test123", login=False)
+        self.client.force_login(self.user)
+        self.url = self.reverse("contest_problem_api")
+
+    def test_contest_problem_list_my_status(self):
+        UserProblemStatus.objects.create(user=self.user, problem_id=self.problem.id,
+                                         rule_type=ProblemRuleType.ACM, status=JudgeStatus.ACCEPTED)
+        resp = self.client.get(f"{self.url}?contest_id={self.contest.id}")
+        self.assertSuccess(resp)
+        self.assertEqual(resp.data["data"][0]["my_status"], JudgeStatus.ACCEPTED)
+
+
 class ContestProblemAdminTest(APITestCase):
     def setUp(self):
         self.url = self.reverse("contest_problem_admin_api")
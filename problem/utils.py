@@ -7,8 +7,23 @@ from functools import lru_cache
 from django.db import transaction
 from django.db.models import Min, F
 
+from utils.cache import cache
+from utils.constants import CacheKey
+
 from .models import Problem, get_default_week_info
 
+# 문제 목록/상세 응답 캐시 TTL (초)
+PROBLEM_CACHE_TIMEOUT = 60
+# 태그별 문제 수는 거의 변하지 않고, 어드민 변경 시 invalidate 되므로 더 길게 잡는다
+PROBLEM_TAG_CACHE_TIMEOUT = 5 * 60
+
+
+def invalidate_problem_cache():
+    """어드민에서 문제가 변경되었을 때 문제/태그 응답 캐시를 비운다"""
+    cache.delete_pattern(f"{CacheKey.problem_cache}:*")
+    cache.delete_pattern(f"{CacheKey.problem_tag_cache}:*")
+
+
 TEMPLATE_BASE = """//PREPEND BEGIN
 {}
 //PREPEND END
@@ -28,7 +28,7 @@ from ..serializers import (CreateContestProblemSerializer, CompileSPJSerializer,
                            AddContestProblemSerializer, ExportProblemSerializer,
                            ExportProblemRequestSerialzier, UploadProblemForm, ImportProblemSerializer,
                            FPSProblemSerializer)
-from ..utils import TEMPLATE_BASE, build_problem_template
+from ..utils import TEMPLATE_BASE, build_problem_template, invalidate_problem_cache
 
 
 class TestCaseZipProcessor(object):
@@ -220,6 +220,7 @@ class ProblemAPI(ProblemBase):
             except ProblemTag.DoesNotExist:
                 tag = ProblemTag.objects.create(name=item)
             problem.tags.add(tag)
+        invalidate_problem_cache()
         return self.success(ProblemAdminSerializer(problem).data)
 
     @problem_permission_required
@@ -280,6 +281,7 @@ class ProblemAPI(ProblemBase):
                 tag = ProblemTag.objects.create(name=tag)
             problem.tags.add(tag)
 
+        invalidate_problem_cache()
         return self.success()
 
     @problem_permission_required
@@ -296,6 +298,7 @@ class ProblemAPI(ProblemBase):
         # if os.path.isdir(d):
         #     shutil.rmtree(d, ignore_errors=True)
         problem.delete()
+        invalidate_problem_cache()
         return self.success()
 
 
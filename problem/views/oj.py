@@ -1,135 +1,183 @@
+import hashlib
 import random
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Min, Max
 from utils.api import APIView
+from utils.cache import cache
 from account.decorators import check_contest_permission, login_required
-from ..models import ProblemTag, Problem, ProblemRuleType
-from ..serializers import ProblemSerializer, TagSerializer, ProblemSafeSerializer, RecommendBonusProblemSerializer
-from contest.models import ContestRuleType
-from account.models import UserProfile
-from submission.models import JudgeStatus
+from ..models import ProblemTag, Problem
+from ..serializers import ProblemSerializer, TagSerializer, ProblemSafeSerializer
+from ..utils import PROBLEM_CACHE_TIMEOUT, PROBLEM_TAG_CACHE_TIMEOUT
+from account.models import UserProblemStatus, UserProfile
+from submission.models import JudgeStatus, Submission
 from django.http import HttpResponseNotFound
-from utils.constants import ProblemScore
+from utils.constants import CacheKey, ProblemScore
 
 
 class ProblemTagAPI(APIView):
     def get(self, request):
-        qs = ProblemTag.objects
         keyword = request.GET.get("keyword")
-        if keyword:
-            qs = ProblemTag.objects.filter(name__icontains=keyword)
-        tags = qs.annotate(problem_count=Count("problem")).filter(problem_count__gt=0)
-        return self.success(TagSerializer(tags, many=True).data)
+        # 임의의 keyword 가 캐시 키에 그대로 들어가지 않도록 목록 캐시처럼 해시한다
+        cache_key = f"{CacheKey.problem_tag_cache}:{hashlib.md5((keyword or '').encode()).hexdigest()}"
+        data = cache.get(cache_key)
+        if data is None:
+            qs = ProblemTag.objects
+            if keyword:
+                qs = ProblemTag.objects.filter(name__icontains=keyword)
+            tags = qs.annotate(problem_count=Count("problem")).filter(problem_count__gt=0)
+            data = TagSerializer(tags, many=True).data
+            cache.set(cache_key, data, timeout=PROBLEM_TAG_CACHE_TIMEOUT)
+        return self.success(data)
 
 
 class PickOneAPI(APIView):
     def get(self, request):
-        problems = Problem.objects.filter(contest_id__isnull=True, visible=True)
-        count = problems.count()
-        if count == 0:
+        problems = Problem.objects.public()
+        id_range = problems.aggregate(min_id=Min("id"), max_id=Max("id"))
+        if id_range["max_id"] is None:
             return self.error("No problem to pick")
-        return self.success(problems[random.randint(0, count - 1)]._id)
+        # 실제 id 범위에서 무작위로 뽑은 뒤 그 이상에서 첫 번째 문제를 가져온다
+        # (OFFSET 스캔 없이 쿼리 한 번으로 해결)
+        picked = problems.filter(id__gte=random.randint(id_range["min_id"], id_range["max_id"])) \
+            .order_by("id").values_list("_id", flat=True).first()
+        return self.success(picked)
+
+
+def serialize_recommend_problems(problems):
+    """
+    id/title/field/tags 만 내보내는 추천·보너스 응답용 경량 직렬화.
+    DRF 필드 바인딩 없이 tags join 이 포함된 values() 한 번으로 만든다
+    """
+    data = {}
+    for row in problems.values("id", "title", "field", "tags__name"):
+        item = data.get(row["id"])
+        if item is None:
+            item = data[row["id"]] = {"id": row["id"], "title": row["title"],
+                                      "field": row["field"], "tags": []}
+        if row["tags__name"] is not None:
+            item["tags"].append(row["tags__name"])
+    return list(data.values())
 
 
 class BonusProblemAPI(APIView):
     def get(self, request):
-        bonus_problems = Problem.objects.filter(contest_id__isnull=True, visible=True, is_bonus=True)
-        if not bonus_problems:
-            return HttpResponseNotFound("No bonus problem")
-        return self.success(RecommendBonusProblemSerializer(bonus_problems, many=True).data)
+        cache_key = f"{CacheKey.problem_cache}:bonus"
+        data = cache.get(cache_key)
+        if data is None:
+            data = serialize_recommend_problems(Problem.objects.public().filter(is_bonus=True))
+            if not data:
+                return HttpResponseNotFound("No bonus problem")
+            cache.set(cache_key, data, timeout=PROBLEM_CACHE_TIMEOUT)
+        return self.success(data)
 
 
 class ProblemAPI(APIView):
     @staticmethod
     def _add_problem_status(request, queryset_values):
-        if request.user.is_authenticated:
-            profile = request.user.userprofile
-            acm_problems_status = profile.acm_problems_status.get("problems", {})
-            oi_problems_status = profile.oi_problems_status.get("problems", {})
-            # paginate data
-            results = queryset_values.get("results")
-            if results is not None:
-                problems = results
-            else:
-                problems = [queryset_values, ]
-            for problem in problems:
-                if problem["rule_type"] == ProblemRuleType.ACM:
-                    problem["my_status"] = acm_problems_status.get(str(problem["id"]), {}).get("status")
-                else:
-                    problem["my_status"] = oi_problems_status.get(str(problem["id"]), {}).get("status")
+        if not request.user.is_authenticated:
+            return
+        # paginate data
+        results = queryset_values.get("results")
+        if results is not None:
+            problems = results
+        else:
+            problems = [queryset_values, ]
+        if not problems:
+            return
+        # profile JSON 전체를 읽는 대신 페이지에 보이는 문제만 테이블에서 조회한다
+        status_map = dict(UserProblemStatus.objects
+                          .filter(user=request.user, problem_id__in=[p["id"] for p in problems])
+                          .values_list("problem_id", "status"))
+        for problem in problems:
+            problem["my_status"] = status_map.get(problem["id"])
 
     def get(self, request):
         # 问题详情页
         problem_id = request.GET.get("problem_id")
         if problem_id:
-            try:
-                problem = Problem.objects.select_related("created_by") \
-                    .get(_id=problem_id, contest_id__isnull=True, visible=True)
+            # my_status 는 캐시된 응답에 사용자별로 덧붙이므로 캐시는 전 사용자가 공유한다
+            cache_key = f"{CacheKey.problem_cache}:detail:{problem_id}"
+            problem_data = cache.get(cache_key)
+            if problem_data is None:
+                try:
+                    problem = Problem.objects.public().get(_id=problem_id)
+                except Problem.DoesNotExist:
+                    return self.error("Problem does not exist")
                 problem_data = ProblemSerializer(problem).data
-                self._add_problem_status(request, problem_data)
-                return self.success(problem_data)
-            except Problem.DoesNotExist:
-                return self.error("Problem does not exist")
+                cache.set(cache_key, problem_data, timeout=PROBLEM_CACHE_TIMEOUT)
+            self._add_problem_status(request, problem_data)
+            return self.success(problem_data)
 
         limit = request.GET.get("limit")
         if not limit:
             return self.error("Limit is needed")
 
-        problems = Problem.objects.select_related("created_by").filter(contest_id__isnull=True, visible=True)
-        # 按照标签筛选
-        tag_text = request.GET.get("tag")
-        if tag_text:
-            problems = problems.filter(tags__name=tag_text)
-
-        # 搜索的情况
-        keyword = request.GET.get("keyword", "").strip()
-        if keyword:
-            problems = problems.filter(Q(title__icontains=keyword) | Q(_id__icontains=keyword))
-
-        # 难度筛选
-        difficulty = request.GET.get("difficulty")
-        if difficulty:
-            problems = problems.filter(difficulty=difficulty)
-
-        field = request.GET.get("field")
-        if field:
-            problems = problems.filter(field=field)
+        query_string = request.META.get("QUERY_STRING", "")
+        cache_key = f"{CacheKey.problem_cache}:list:{hashlib.md5(query_string.encode()).hexdigest()}"
+        data = cache.get(cache_key)
+        if data is None:
+            problems = Problem.objects.public() \
+                .defer("test_case_score", "test_case_id", "spj_code", "spj_version", "spj_compile_ok")
+            # 按照标签筛选
+            tag_text = request.GET.get("tag")
+            if tag_text:
+                problems = problems.filter(tags__name=tag_text)
+
+            # 搜索的情况
+            keyword = request.GET.get("keyword", "").strip()
+            if keyword:
+                problems = problems.filter(Q(title__icontains=keyword) | Q(_id__icontains=keyword))
+
+            # 难度筛选
+            difficulty = request.GET.get("difficulty")
+            if difficulty:
+                problems = problems.filter(difficulty=difficulty)
+
+            field = request.GET.get("field")
+            if field:
+                problems = problems.filter(field=field)
+
+            # COUNT 는 offset/limit 과 무관하므로 필터 조합 단위로 캐시해서
+            # 페이지를 넘길 때마다 다시 세지 않는다
+            filter_key = hashlib.md5(f"{tag_text}:{keyword}:{difficulty}:{field}".encode()).hexdigest()
+            data = self.paginate_data(request, problems, ProblemSerializer,
+                                      count_cache_key=f"{CacheKey.problem_cache}:count:{filter_key}")
+            cache.set(cache_key, data, timeout=PROBLEM_CACHE_TIMEOUT)
 
         # 根据profile 为做过的题目添加标记
-        data = self.paginate_data(request, problems, ProblemSerializer)
         self._add_problem_status(request, data)
         return self.success(data)
 
 
 class ContestProblemAPI(APIView):
     def _add_problem_status(self, request, queryset_values):
-        if request.user.is_authenticated:
-            profile = request.user.userprofile
-            if self.contest.rule_type == ContestRuleType.ACM:
-                problems_status = profile.acm_problems_status.get("contest_problems", {})
-            else:
-                problems_status = profile.oi_problems_status.get("contest_problems", {})
-            for problem in queryset_values:
-                problem["my_status"] = problems_status.get(str(problem["id"]), {}).get("status")
+        if not request.user.is_authenticated or not queryset_values:
+            return
+        status_map = dict(UserProblemStatus.objects
+                          .filter(user=request.user, problem_id__in=[p["id"] for p in queryset_values])
+                          .values_list("problem_id", "status"))
+        for problem in queryset_values:
+            problem["my_status"] = status_map.get(problem["id"])
 
     @check_contest_permission(check_type="problems")
     def get(self, request):
         problem_id = request.GET.get("problem_id")
         if problem_id:
             try:
-                problem = Problem.objects.select_related("created_by").get(_id=problem_id,
-                                                                           contest=self.contest,
-                                                                           visible=True)
+                problem = Problem.objects.select_related("created_by").prefetch_related("tags") \
+                    .get(_id=problem_id, contest=self.contest, visible=True)
             except Problem.DoesNotExist:
                 return self.error("Problem does not exist.")
-            if self.contest.problem_details_permission(request.user):
+            if self.can_see_problem_details:
                 problem_data = ProblemSerializer(problem).data
                 self._add_problem_status(request, [problem_data, ])
             else:
                 problem_data = ProblemSafeSerializer(problem).data
             return self.success(problem_data)
 
-        contest_problems = Problem.objects.select_related("created_by").filter(contest=self.contest, visible=True)
-        if self.contest.problem_details_permission(request.user):
+        contest_problems = Problem.objects.select_related("created_by").prefetch_related("tags") \
+            .defer("test_case_score", "test_case_id", "spj_code", "spj_version", "spj_compile_ok") \
+            .filter(contest=self.contest, visible=True)
+        if self.can_see_problem_details:
             data = ProblemSerializer(contest_problems, many=True).data
             self._add_problem_status(request, data)
         else:
@@ -137,16 +185,12 @@ class ContestProblemAPI(APIView):
         return self.success(data)
 
 
-def get_user_solved_problems(user):
-    solved_problems = UserProfile.objects.get(user=user).acm_problems_status.get("problems", {})
-    return [v['_id'] for k, v in solved_problems.items() if v['status'] == JudgeStatus.ACCEPTED]
-
-
 class AIRecommendProblemAPI(APIView):
     @login_required
     def get(self, request):
         try:
-            field_score = UserProfile.objects.get(user=request.user).field_score
+            profile = UserProfile.objects.get(user=request.user)
+            field_score = profile.field_score
             field_score['max_score'] = ProblemScore.score['VeryHigh'] * 20
 
             weak_field = 0
@@ -158,10 +202,13 @@ class AIRecommendProblemAPI(APIView):
                     weak_field_score = field_score[k]
 
             # remove if the user has solved the problem
-            unresolved_problems = Problem.objects.filter(field=weak_field, visible=True)\
-                .exclude(_id__in=get_user_solved_problems(request.user))
-            unresolved_problems = random.sample(list(unresolved_problems), min(3, unresolved_problems.count()))
-            recommend_problems = RecommendBonusProblemSerializer(unresolved_problems, many=True).data
+            # 푼 문제 목록을 파이썬으로 만들어 IN 절에 싣는 대신 서브쿼리로 내린다
+            solved_problems = Submission.objects.filter(user_id=request.user.id,
+                                                        result=JudgeStatus.ACCEPTED).values("problem_id")
+            picked_ids = list(Problem.objects.filter(field=weak_field, visible=True)
+                              .exclude(id__in=solved_problems)
+                              .order_by("?").values_list("id", flat=True)[:3])
+            recommend_problems = serialize_recommend_problems(Problem.objects.filter(id__in=picked_ids))
 
             return self.success({"field_score": field_score, "recommend_problems": recommend_problems})
         except UserProfile.DoesNotExist:
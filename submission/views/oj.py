@@ -57,8 +57,7 @@ class SubmissionAPI(APIView):
             error = self.check_contest_permission(request)
             if error:
                 return error
-            contest = self.contest
-            if not contest.problem_details_permission(request.user):
+            if not self.can_see_problem_details:
                 hide_id = True
 
         if data.get("captcha"):
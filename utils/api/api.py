@@ -2,11 +2,15 @@ import functools
 import json
 import logging
 
+import orjson
+
 from django.http import HttpResponse, QueryDict
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
+from utils.cache import cache
+
 logger = logging.getLogger("")
 
 
@@ -45,7 +49,10 @@ class JSONResponse(object):
 
     @classmethod
     def response(cls, data):
-        resp = HttpResponse(json.dumps(data, indent=4), content_type=cls.content_type)
+        # orjson 이 stdlib json 보다 수 배 빠르고, indent 를 빼서 응답 크기도 줄인다.
+        # OPT_NON_STR_KEYS 는 int 키를 문자열로 바꾸던 기존 동작을 유지하기 위한 것
+        resp = HttpResponse(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+                            content_type=cls.content_type)
         resp.data = data
         return resp
 
@@ -110,11 +117,13 @@ class APIView(View):
     def server_error(self):
         return self.error(err="server-error", msg="server error")
 
-    def paginate_data(self, request, query_set, object_serializer=None):
+    def paginate_data(self, request, query_set, object_serializer=None, count_cache_key=None):
         """
         :param request: django的request
         :param query_set: django model的query set或者其他list like objects
         :param object_serializer: 用来序列化query set, 如果为None, 则直接对query set切片
+        :param count_cache_key: 전체 건수 COUNT 를 30초 캐시할 키. offset/limit 과 무관하게
+            같은 필터면 키가 같도록 호출부에서 만들어야 한다 (페이지 이동 시 COUNT 재실행 방지)
         :return:
         """
         try:
@@ -130,11 +139,15 @@ class APIView(View):
         if offset < 0:
             offset = 0
         results = query_set[offset:offset + limit]
-        if object_serializer:
-            count = query_set.count()
-            results = object_serializer(results, many=True).data
+        if count_cache_key:
+            count = cache.get(count_cache_key)
+            if count is None:
+                count = query_set.count()
+                cache.set(count_cache_key, count, timeout=30)
         else:
             count = query_set.count()
+        if object_serializer:
+            results = object_serializer(results, many=True).data
         data = {"results": results,
                 "total": count}
         return data
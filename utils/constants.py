@@ -25,6 +25,9 @@ class CacheKey:
     waiting_queue = "waiting_queue"
     contest_rank_cache = "contest_rank_cache"
     website_config = "website_config"
+    problem_cache = "problem_cache"
+    problem_tag_cache = "problem_tag_cache"
+    user_count_cache = "user_count_cache"
 
 
 class Difficulty(Choices):
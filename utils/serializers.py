@@ -1,8 +1,27 @@
+import copy
+
 from rest_framework import serializers
 
 from options.options import SysOptions
 
 
+class CachedFieldsSerializerMixin:
+    """
+    DRF 는 serializer 를 만들 때마다 필드 전체를 deepcopy 하는데,
+    자주 호출되는 읽기 전용 serializer 에서는 이 초기화 비용이 상당히 크다.
+    get_fields() 결과를 클래스에 캐시해두고 인스턴스마다 unbound 상태의
+    shallow copy 만 돌려줘서 deepcopy 를 클래스당 한 번으로 줄인다.
+    """
+
+    def get_fields(self):
+        cached = self.__class__.__dict__.get("_cached_fields")
+        if cached is None:
+            cached = super().get_fields()
+            self.__class__._cached_fields = cached
+        # bind() 는 여기서 돌려준 copy 에만 일어나므로 캐시는 unbound 로 유지된다
+        return {name: copy.copy(field) for name, field in cached.items()}
+
+
 class InvalidLanguage(serializers.ValidationError):
     def __init__(self, name):
         super().__init__(detail=f"{name} is not a valid language")